@@ -1,8 +1,11 @@
+import bisect
 import json
+import os
 from pathlib import Path
 
 import tkinter as tk
 from tkinter import ttk, simpledialog
+from tkinter import font as tkfont
 
 # -----------------------------
 # Cyberpunk Task Board (Tkinter)
@@ -34,6 +37,12 @@ TEXT_FONT = ("Segoe UI", 11)
 CARD_PADY = 8
 CARD_PADX = 10
 
+# Pack options for a card's title slot, shared by the label and the inline editor
+TITLE_PACK = {"side": "left", "padx": 10, "pady": 10, "fill": "x", "expand": True}
+
+SAVE_DELAY_MS = 250
+DRAG_INTERVAL_MS = 16
+
 
 class ScrollableArea(ttk.Frame):
     """A scrollable area containing a Canvas with an interior Frame."""
@@ -47,6 +56,8 @@ class ScrollableArea(ttk.Frame):
 
         self.inner = tk.Frame(self.canvas, bg=bg)
         self.window_id = self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
+        self._last_width = -1
+        self._last_bbox = None
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.vbar.pack(side="right", fill="y")
@@ -54,23 +65,62 @@ class ScrollableArea(ttk.Frame):
         self.inner.bind("<Configure>", self._on_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
-        # Mouse wheel support (Windows/Mac/Linux)
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel_linux)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel_linux)
+        # Mouse wheel support (Windows/Mac/Linux), active only while the area
+        # (canvas or scrollbar) is hovered
+        self._wheel_funcids = []
+        self.bind("<Enter>", lambda e: self._bind_wheel())
+        self.bind("<Leave>", self._on_leave)
 
     def _on_configure(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.canvas.itemconfigure(self.window_id, width=self.canvas.winfo_width())
+        # Only push values to Tk when they actually changed
+        bbox = self.canvas.bbox("all")
+        if bbox != self._last_bbox:
+            self.canvas.configure(scrollregion=bbox)
+            self._last_bbox = bbox
+        self._set_inner_width(self.canvas.winfo_width())
 
     def _on_canvas_configure(self, event):
-        self.canvas.itemconfigure(self.window_id, width=event.width)
+        self._set_inner_width(event.width)
+
+    def _set_inner_width(self, width):
+        if width != self._last_width:
+            self.canvas.itemconfigure(self.window_id, width=width)
+            self._last_width = width
+
+    def _bind_wheel(self):
+        if self._wheel_funcids:
+            return  # this area already owns the wheel
+        self._wheel_funcids = [
+            (sequence, self.canvas.bind_all(sequence, handler))
+            for sequence, handler in (
+                ("<MouseWheel>", self._on_mousewheel),
+                ("<Button-4>", self._on_mousewheel_linux),
+                ("<Button-5>", self._on_mousewheel_linux),
+            )
+        ]
+
+    def _unbind_wheel(self):
+        """Drop the global wheel bindings and their Tcl callbacks."""
+        root = self._root()
+        for sequence, funcid in self._wheel_funcids:
+            root.unbind_all(sequence)
+            root.deletecommand(funcid)
+        self._wheel_funcids = []
+
+    def _on_leave(self, event):
+        # Moving onto the canvas, scrollbar or a card inside the area also
+        # fires <Leave>; keep scrolling there
+        widget = self.winfo_containing(event.x_root, event.y_root)
+        while widget is not None:
+            if widget is self:
+                return
+            widget = widget.master
+        self._unbind_wheel()
 
     def _on_mousewheel(self, event):
         # Windows/MacOS
-        if event.widget is self.canvas or str(event.widget).startswith(str(self.inner)):
-            delta = int(-1 * (event.delta / 120))
-            self.canvas.yview_scroll(delta, "units")
+        delta = int(-1 * (event.delta / 120))
+        self.canvas.yview_scroll(delta, "units")
 
     def _on_mousewheel_linux(self, event):
         # Linux
@@ -82,6 +132,14 @@ class ScrollableArea(ttk.Frame):
 
 class TaskCard:
     """A draggable card representing a single task."""
+
+    __slots__ = (
+        "app", "parent_frame", "text",
+        "shadow", "frame", "handle", "title", "edit_btn", "complete_btn", "delete_btn", "underline",
+        "_drag_tag", "_drag_funcids", "_drag_index", "_cached_centers", "_cached_heights",
+        "_pending_pointer_y", "_motion_after_id", "_editor",
+    )
+
     def __init__(self, app, parent_frame, text):
         self.app = app
         self.parent_frame = parent_frame
@@ -92,111 +150,115 @@ class TaskCard:
         self.frame = tk.Frame(self.shadow, bg=CARD_BG, highlightthickness=2,
                               highlightbackground=CARD_BORDER, highlightcolor=CARD_BORDER)
 
-        # Header: drag handle + title + complete button
-        self.header = tk.Frame(self.frame, bg=CARD_BG)
+        # Header row (drag handle + title + action buttons) packs straight into
+        # the card frame; no intermediate header widget per card
         our_handle = "≡"
-        self.handle = tk.Label(self.header, text=our_handle, fg=NEON_CYAN, bg=CARD_BG, font=TITLE_FONT)
-        self.title = tk.Label(self.header, text=self.text, fg=TEXT_LIGHT, bg=CARD_BG, font=TEXT_FONT, wraplength=700, justify="left")
-        self.edit_btn = tk.Button(
-            self.header,
-            text="✎",
-            fg=NEON_MAGENTA,
-            bg="#1a0b14",
-            activebackground="#33101f",
-            activeforeground=NEON_MAGENTA,
-            bd=0,
-            relief="flat",
-            font=TITLE_FONT,
-            command=self.edit,
-        )
-        self.complete_btn = tk.Button(
-            self.header,
-            text="-",
-            fg=NEON_LIME,
-            bg="#0b1a12",
-            activebackground="#10331d",
-            activeforeground=NEON_LIME,
-            bd=0,
-            relief="flat",
-            font=TITLE_FONT,
-            command=self.complete,
-        )
-        self.delete_btn = tk.Button(
-            self.header,
-            text="✕",
-            fg=NEON_RED,
-            bg="#140b0b",
-            activebackground="#330f0f",
-            activeforeground=NEON_RED,
-            bd=0,
-            relief="flat",
-            font=TITLE_FONT,
-            command=self.delete,
-        )
-
-        self.header.pack(fill="x", padx=12, pady=10)
-        self.handle.pack(side="left")
-        self.title.pack(side="left", padx=10, fill="x", expand=True)
-        self.delete_btn.pack(side="right", padx=(0, 6))
-        self.complete_btn.pack(side="right")
-        self.edit_btn.pack(side="right")
-
-        # Subtle neon underline
+        self.handle = tk.Label(self.frame, text=our_handle, fg=NEON_CYAN, bg=CARD_BG, font=self.app.title_font)
+        self.title = tk.Label(self.frame, text=self.text, fg=TEXT_LIGHT, bg=CARD_BG, font=self.app.text_font, wraplength=700, justify="left")
+        # Action buttons share ttk styles defined once in TaskBoardApp._setup_style
+        self.edit_btn = ttk.Button(self.frame, text="✎", style="Edit.Neon.TButton", command=self.edit)
+        self.complete_btn = ttk.Button(self.frame, text="-", style="Complete.Neon.TButton", command=self.complete)
+        self.delete_btn = ttk.Button(self.frame, text="✕", style="Delete.Neon.TButton", command=self.delete)
+
+        # Subtle neon underline (packed first so it spans the bottom edge)
         self.underline = tk.Frame(self.frame, height=2, bg=NEON_MAGENTA)
-        self.underline.pack(fill="x")
+        self.underline.pack(side="bottom", fill="x")
+
+        self.handle.pack(side="left", padx=(12, 0), pady=10)
+        self.title.pack(**TITLE_PACK)
+        self.delete_btn.pack(side="right", padx=(0, 18), pady=10)
+        self.complete_btn.pack(side="right", pady=10)
+        self.edit_btn.pack(side="right", pady=10)
 
         self.frame.pack(fill="x", expand=True, padx=2, pady=2)
         self.shadow.pack(fill="x", padx=CARD_PADX, pady=CARD_PADY)
 
-        # Drag bindings (use handle or whole card)
-        drag_targets = [self.frame, self.header, self.handle, self.title]
+        # Drag bindings (use handle or whole card), shared through one bindtag
+        # so they can be removed in a fixed number of calls
+        self._drag_tag = f"card{id(self)}"
+        drag_targets = [self.frame, self.handle, self.title]
         for w in drag_targets:
-            w.bind("<Button-1>", self.on_drag_start)
-            w.bind("<B1-Motion>", self.on_drag_motion)
-            w.bind("<ButtonRelease-1>", self.on_drag_release)
+            w.bindtags((self._drag_tag,) + w.bindtags())
+        root = self.app.root
+        self._drag_funcids = [
+            (sequence, root.bind_class(self._drag_tag, sequence, handler))
+            for sequence, handler in (
+                ("<Button-1>", self.on_drag_start),
+                ("<B1-Motion>", self.on_drag_motion),
+                ("<ButtonRelease-1>", self.on_drag_release),
+            )
+        ]
 
         self._drag_index = None
+        self._cached_centers = None
+        self._cached_heights = None
+        self._pending_pointer_y = 0
+        self._motion_after_id = None
+        self._editor = None
 
     # ---- Drag & drop ordering ----
-    def on_drag_start(self, event):
+    def on_drag_start(self, event, _mag=NEON_MAGENTA):
         try:
             self._drag_index = self.app.tasks.index(self)
         except ValueError:
             self._drag_index = None
-        self.shadow.configure(bg=NEON_MAGENTA)  # highlight during drag
+        else:
+            # Snapshot card geometry once; it only changes when we reorder
+            self._cached_heights = [card.shadow.winfo_height() or 1 for card in self.app.tasks]
+            self._cached_centers = [card.shadow.winfo_y() + h / 2
+                                    for card, h in zip(self.app.tasks, self._cached_heights)]
+        self.shadow.configure(bg=_mag)  # highlight during drag
 
-    def on_drag_motion(self, event):
+    def on_drag_motion(self, event, _interval=DRAG_INTERVAL_MS):
         if self._drag_index is None:
             return
         container = self.parent_frame  # tasks area frame
-        pointer_y = container.winfo_pointery() - container.winfo_rooty()
+        self._pending_pointer_y = event.y_root - container.winfo_rooty()
+
+        # Only the latest pointer position matters; process it at ~60 fps
+        if self._motion_after_id is None:
+            self._motion_after_id = self.app.root.after(_interval, self._process_drag_motion)
+
+    def _process_drag_motion(self):
+        self._motion_after_id = None
+        if self._drag_index is None:
+            return
+        pointer_y = self._pending_pointer_y
 
         # Determine target index based on pointer position vs centers of sibling cards
         cards = self.app.tasks
-        y_centers = []
-        for card in cards:
-            y = card.shadow.winfo_y()
-            h = card.shadow.winfo_height() or 1
-            y_centers.append(y + h / 2)
-
-        target_index = self._drag_index
-        for i, c_y in enumerate(y_centers):
-            if pointer_y < c_y:
-                target_index = i
-                break
-        else:
-            target_index = len(cards) - 1
+        y_centers = self._cached_centers
+
+        # Centers are sorted top to bottom, so the first one below the pointer is found by bisection
+        target_index = min(bisect.bisect_right(y_centers, pointer_y), len(cards) - 1)
 
         if target_index != self._drag_index:
             # Reorder list and repack
             card = cards.pop(self._drag_index)
             cards.insert(target_index, card)
+            self._update_cached_centers(self._drag_index, target_index)
+            self.app.move_card_in_pack(card, self._drag_index, target_index)
             self._drag_index = target_index
-            self.app.repack_task_cards()
 
-    def on_drag_release(self, event):
-        self.shadow.configure(bg=NEON_CYAN)
+    def _update_cached_centers(self, old_index, new_index, _pady=CARD_PADY):
+        """Recompute cached centers for the slots between old_index and new_index."""
+        heights = self._cached_heights
+        lo, hi = min(old_index, new_index), max(old_index, new_index)
+        top = self._cached_centers[lo] - heights[lo] / 2
+        heights.insert(new_index, heights.pop(old_index))
+        for i in range(lo, hi + 1):
+            self._cached_centers[i] = top + heights[i] / 2
+            top += heights[i] + 2 * _pady
+
+    def on_drag_release(self, event, _cyan=NEON_CYAN):
+        if self._motion_after_id is not None:
+            # Apply the last pointer position before the drag ends
+            self.app.root.after_cancel(self._motion_after_id)
+            self._process_drag_motion()
+        self.shadow.configure(bg=_cyan)
         self._drag_index = None
+        self._cached_centers = None
+        self._cached_heights = None
         self.app.save_state()
 
     # ---- Actions ----
@@ -206,14 +268,19 @@ class TaskCard:
         self.shadow.configure(bg=NEON_LIME)
 
         # Disable dragging
-        for w in [self.frame, self.header, self.handle, self.title]:
-            w.unbind("<Button-1>")
-            w.unbind("<B1-Motion>")
-            w.unbind("<ButtonRelease-1>")
+        self._unbind_drag()
 
         # Swap the complete button to a restore action
         self.complete_btn.configure(text="+", command=self.restore, state="normal")
 
+    def _unbind_drag(self):
+        """Drop this card's drag bindings and their Tcl callbacks."""
+        root = self.app.root
+        for sequence, funcid in self._drag_funcids:
+            root.unbind_class(self._drag_tag, sequence)
+            root.deletecommand(funcid)
+        self._drag_funcids = []
+
     def complete(self, save=True):
         """Move this card to the completed tab."""
         # Create a completed-task card before removing this one
@@ -221,8 +288,10 @@ class TaskCard:
         self.app.notebook.select(self.app.tab_completed)
 
         # Remove and destroy the original card
-        if self in self.app.tasks:
+        if self in self.app._tasks_set:
+            self.app._tasks_set.discard(self)
             self.app.tasks.remove(self)
+        self._unbind_drag()
         self.shadow.destroy()
         self.app.repack_task_cards()
 
@@ -231,26 +300,50 @@ class TaskCard:
 
     def delete(self):
         """Remove this task card entirely."""
-        if self in self.app.tasks:
+        if self in self.app._tasks_set:
+            self.app._tasks_set.discard(self)
             self.app.tasks.remove(self)
             self.app.repack_task_cards()
-        elif self in self.app.completed:
+        elif self in self.app._completed_set:
+            self.app._completed_set.discard(self)
             self.app.completed.remove(self)
+        self._unbind_drag()
         self.shadow.destroy()
         self.app.refresh_scrollregions()
         self.app.save_state()
 
     def edit(self):
-        new_text = simpledialog.askstring("Edit Task", "Edit the task:", initialvalue=self.text, parent=self.app.root)
-        if new_text:
-            self.text = new_text.strip()
+        """Swap the title for an inline entry until Return or Escape."""
+        if self._editor is not None:
+            self._editor.focus_set()
+            return
+        self._editor = tk.Entry(self.frame, fg=TEXT_LIGHT, bg=CARD_BG, insertbackground=NEON_CYAN,
+                                font=self.app.text_font, relief="flat", highlightthickness=1,
+                                highlightbackground=CARD_BORDER, highlightcolor=NEON_CYAN)
+        self._editor.insert(0, self.text)
+        self._editor.select_range(0, "end")
+        self._editor.pack(after=self.title, **TITLE_PACK)
+        self.title.pack_forget()
+        self._editor.bind("<Return>", lambda e: self._finish_edit(commit=True))
+        self._editor.bind("<Escape>", lambda e: self._finish_edit(commit=False))
+        self._editor.focus_set()
+
+    def _finish_edit(self, commit):
+        new_text = self._editor.get().strip()
+        self.title.pack(before=self._editor, **TITLE_PACK)
+        self._editor.destroy()
+        self._editor = None
+        if commit and new_text:
+            self.text = new_text
             self.title.configure(text=self.text)
             self.app.save_state()
 
     def restore(self, save=True):
         """Return this completed card to the active tasks list."""
-        if self in self.app.completed:
+        if self in self.app._completed_set:
+            self.app._completed_set.discard(self)
             self.app.completed.remove(self)
+        self._unbind_drag()
         self.shadow.destroy()
 
         self.app.add_task(self.text, save=False)
@@ -272,11 +365,15 @@ class TaskBoardApp:
         self._drag_x = 0
         self._drag_y = 0
 
+        # Shared font objects so cards don't each re-parse a font spec
+        self.title_font = tkfont.Font(root=self.root, font=TITLE_FONT)
+        self.text_font = tkfont.Font(root=self.root, font=TEXT_FONT)
+
         self._setup_style()
 
         # Custom title bar
         titlebar = tk.Frame(root, bg="black")
-        title_label = tk.Label(titlebar, text="CYBERPUNK TASK LIST", fg=NEON_CYAN, bg="black", font=TITLE_FONT)
+        title_label = tk.Label(titlebar, text="CYBERPUNK TASK LIST", fg=NEON_CYAN, bg="black", font=self.title_font)
         add_btn = tk.Button(titlebar, text="＋", fg=TEXT_LIGHT, bg=BG_PANEL, activebackground=NEON_MAGENTA,
                             activeforeground=TEXT_LIGHT, bd=0, relief="flat", font=("Segoe UI", 18, "bold"),
                             command=self.add_task_dialog)
@@ -341,6 +438,16 @@ class TaskBoardApp:
         self.data_file = Path(__file__).with_name("tasks.json")
         self.tasks = []
         self.completed = []
+        # Membership mirrors of the ordered lists above for O(1) lookups
+        self._tasks_set = set()
+        self._completed_set = set()
+        # Completed texts loaded from disk but not yet built into cards; the
+        # Completed tab is off-screen until selected, so its cards are built lazily
+        self._pending_completed = []
+        self._repack_pending = False
+        self._last_order = []
+        self._scroll_refresh_pending = False
+        self._save_after_id = None
         if not self.load_state():
             for t in [
                 "Patch proxies to 12.2.18",
@@ -351,6 +458,8 @@ class TaskBoardApp:
                 self.add_task(t, save=False)
             self.save_state()
 
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         # Ensure state is saved when window closes
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
@@ -371,6 +480,20 @@ class TaskBoardApp:
                   background=[("selected", BG_DARK)],
                   foreground=[("selected", NEON_CYAN)])
 
+        # Card action buttons: one shared base style plus a color variant each
+        style.configure("Neon.TButton", font=self.title_font, borderwidth=0, relief="flat",
+                        padding=(4, 0), width=0)
+        for name, fg, bg, active_bg in (
+            ("Edit", NEON_MAGENTA, "#1a0b14", "#33101f"),
+            ("Complete", NEON_LIME, "#0b1a12", "#10331d"),
+            ("Delete", NEON_RED, "#140b0b", "#330f0f"),
+        ):
+            style.configure(f"{name}.Neon.TButton", foreground=fg, background=bg,
+                            bordercolor=bg, lightcolor=bg, darkcolor=bg, focuscolor=bg)
+            style.map(f"{name}.Neon.TButton",
+                      background=[("active", active_bg)],
+                      foreground=[("active", fg)])
+
     # ---- Task operations ----
     def add_task_dialog(self):
         text = simpledialog.askstring("New Task", "Describe the task:", parent=self.root)
@@ -380,48 +503,146 @@ class TaskBoardApp:
     def add_task(self, text: str, save=True):
         card = TaskCard(self, self.active_area.inner, text)
         self.tasks.append(card)
+        self._tasks_set.add(card)
         self.repack_task_cards()
         self.refresh_scrollregions()
         if save:
             self.save_state()
         return card
 
+    def add_task_bulk(self, text: str, completed=False):
+        """Create a card without repacking, refreshing, or saving.
+
+        Callers adding many cards at once repack and refresh once afterwards.
+        """
+        if completed:
+            card = TaskCard(self, self.completed_area.inner, text)
+            card.mark_as_completed()
+            self.completed.append(card)
+            self._completed_set.add(card)
+        else:
+            card = TaskCard(self, self.active_area.inner, text)
+            self.tasks.append(card)
+            self._tasks_set.add(card)
+        return card
+
     def add_completed_task(self, text: str, save=True):
-        card = TaskCard(self, self.completed_area.inner, text)
-        card.mark_as_completed()
-        self.completed.append(card)
+        self._materialize_completed()
+        card = self.add_task_bulk(text, completed=True)
         self.refresh_scrollregions()
         if save:
             self.save_state()
         return card
 
+    def _materialize_completed(self):
+        """Build cards for any completed tasks deferred at load time."""
+        if not self._pending_completed:
+            return
+        pending, self._pending_completed = self._pending_completed, []
+        for text in pending:
+            self.add_task_bulk(text, completed=True)
+        self.refresh_scrollregions()
+
+    def _on_tab_changed(self, event):
+        if self.notebook.select() == str(self.tab_completed):
+            self._materialize_completed()
+
     def repack_task_cards(self):
-        # Repack active tasks in current order
-        for card in self.tasks:
-            try:
-                card.shadow.pack_forget()
-            except Exception:
-                pass
-        for card in self.tasks:
-            card.shadow.pack(fill="x", padx=CARD_PADX, pady=CARD_PADY)
+        # Zero or one card can't be out of order; every card packs itself on creation
+        if len(self.tasks) < 2:
+            self._last_order = list(self.tasks)
+            self.refresh_scrollregions()
+            return
+        # Coalesce repacks into a single idle callback per event burst
+        if self._repack_pending:
+            return
+        self._repack_pending = True
+        self.root.after_idle(self._do_repack)
+
+    def _do_repack(self, _padx=CARD_PADX, _pady=CARD_PADY):
+        self._repack_pending = False
+        order = list(self.tasks)
+        # Removed cards are already gone from the pack; drop them so a pure
+        # removal compares equal instead of re-packing the whole tail
+        self._last_order = [card for card in self._last_order if card in self._tasks_set]
+        if order == self._last_order:
+            return
+
+        # Cards before the first changed slot are already packed in place;
+        # only the tail from that point on needs to be moved.
+        start = 0
+        for card, prev in zip(order, self._last_order):
+            if card is not prev:
+                break
+            start += 1
+
+        # Relocate each card straight after its predecessor with a single pack
+        # call; no pack_forget, so each card goes through geometry once
+        if start == 0 and order:
+            slaves = self.active_area.inner.pack_slaves()
+            first = order[0].shadow
+            if slaves and slaves[0] is not first:
+                first.pack(fill="x", padx=_padx, pady=_pady, before=slaves[0])
+            start = 1
+        for i in range(start, len(order)):
+            order[i].shadow.pack(fill="x", padx=_padx, pady=_pady, after=order[i - 1].shadow)
+        self._last_order = order
         self.refresh_scrollregions()
 
+    def move_card_in_pack(self, card, old_index, new_index, _padx=CARD_PADX, _pady=CARD_PADY):
+        """Relocate one card in the pack order to match its slot in ``self.tasks``."""
+        if self._repack_pending:
+            # A full flush is already queued and will pick up the new order
+            return
+        # pack(before=/after=) moves an already-packed card in place
+        if new_index + 1 < len(self.tasks):
+            card.shadow.pack(fill="x", padx=_padx, pady=_pady,
+                             before=self.tasks[new_index + 1].shadow)
+        else:
+            card.shadow.pack(fill="x", padx=_padx, pady=_pady,
+                             after=self.tasks[new_index - 1].shadow)
+        self._last_order.insert(new_index, self._last_order.pop(old_index))
+
     def refresh_scrollregions(self):
-        # Force scrollregion update
-        self.root.update_idletasks()
+        # Schedule one scrollregion update per event cycle instead of forcing
+        # a synchronous geometry pass
+        if self._scroll_refresh_pending:
+            return
+        self._scroll_refresh_pending = True
+        self.root.after_idle(self._do_refresh_scroll)
+
+    def _do_refresh_scroll(self):
+        self._scroll_refresh_pending = False
         self.active_area._on_configure(None)
         self.completed_area._on_configure(None)
 
     def save_state(self):
+        # Debounce disk writes so a burst of edits is saved once
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SAVE_DELAY_MS, self._save_state_now)
+
+    def _save_state_now(self):
+        self._save_after_id = None
         data = {
             "tasks": [card.text for card in self.tasks],
-            "completed": [card.text for card in self.completed],
+            "completed": [card.text for card in self.completed] + self._pending_completed,
         }
+        # Write to a temp file, sync it to disk, then swap it in, so neither a
+        # crash nor a power loss can leave tasks.json half-written
+        tmp = self.data_file.with_suffix(".json.tmp")
         try:
-            with self.data_file.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            with tmp.open("wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.data_file)
         except Exception:
-            pass
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
 
     def load_state(self):
         if not self.data_file.exists():
@@ -430,16 +651,19 @@ class TaskBoardApp:
             with self.data_file.open("r", encoding="utf-8") as f:
                 data = json.load(f)
             for text in data.get("tasks", []):
-                self.add_task(text, save=False)
-            for text in data.get("completed", []):
-                self.add_completed_task(text, save=False)
+                self.add_task_bulk(text)
+            self._pending_completed = list(data.get("completed", []))
+            # Each card packed itself in list order, so there is nothing to repack
+            self._last_order = list(self.tasks)
             self.refresh_scrollregions()
             return True
         except Exception:
             return False
 
     def on_close(self):
-        self.save_state()
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_state_now()
         self.root.destroy()
 
 